@@ -8,7 +8,7 @@ __version__ = "0.1.0"
 
 from .responses import error_response, not_found_response, success_response
 from .router import ToolRouter
-from .server import MCPServerBase
+from .server import MCPServerBase, tool
 
 __all__ = [
     "MCPServerBase",
@@ -16,4 +16,5 @@ __all__ = [
     "error_response",
     "not_found_response",
     "success_response",
+    "tool",
 ]
@@ -44,4 +44,5 @@ def not_found_response(resource_type: str, resource_id: str) -> dict[str, Any]:
     Returns:
         Dict with success=False and appropriate error message
     """
-    return error_response(f"{resource_type} not found: {resource_id}")
+    # Built directly rather than via error_response to skip the call and kwargs handling
+    return {"success": False, "error": f"{resource_type} not found: {resource_id}"}
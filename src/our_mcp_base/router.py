@@ -5,6 +5,7 @@ Provides a decorator-based registry for dispatching tool calls to handler functi
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from typing import Any
 
@@ -27,8 +28,11 @@ class ToolRouter:
         result = router.dispatch(name, arguments)
     """
 
+    __slots__ = ("_handlers", "_names_cache")
+
     def __init__(self) -> None:
         self._handlers: dict[str, Callable[..., dict[str, Any]]] = {}
+        self._names_cache: tuple[str, ...] | None = None
 
     def register(self, name: str) -> Callable[[Callable[..., dict[str, Any]]], Callable[..., dict[str, Any]]]:
         """Decorator to register a tool handler.
@@ -38,7 +42,9 @@ class ToolRouter:
         """
 
         def decorator(func: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
-            self._handlers[name] = func
+            # Interned so lookups with names interned by MCPServerBase hit on identity
+            self._handlers[sys.intern(name)] = func
+            self._names_cache = None
             return func
 
         return decorator
@@ -53,9 +59,11 @@ class ToolRouter:
         Returns:
             Handler result or error if tool not found
         """
-        handler = self._handlers.get(name)
-        if handler is None:
+        try:
+            handler = self._handlers[name]
+        except KeyError:
             return error_response(f"Unknown tool: {name}")
+        # Called outside the try so a KeyError raised by the handler propagates
         return handler(**arguments)
 
     def has_tool(self, name: str) -> bool:
@@ -64,5 +72,11 @@ class ToolRouter:
 
     @property
     def tool_names(self) -> list[str]:
-        """Get list of registered tool names."""
-        return list(self._handlers.keys())
+        """Get list of registered tool names.
+
+        The names are snapshotted once per registration; each access returns a
+        fresh list copied from that snapshot.
+        """
+        if self._names_cache is None:
+            self._names_cache = tuple(self._handlers)
+        return list(self._names_cache)
@@ -9,19 +9,104 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import inspect
 import json
 import logging
 import sys
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, ClassVar, TypeVar, cast
 
 from mcp.server import Server
+from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
+from .responses import error_response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    uvloop = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def tool(name: str) -> Callable[[_F], _F]:
+    """Decorator marking an MCPServerBase method as the handler for a tool.
+
+    The default handle_tool dispatches to marked methods by name, calling them
+    with the tool arguments as keyword arguments.
+
+    Args:
+        name: Tool name to register
+    """
+
+    def decorator(func: _F) -> _F:
+        func._tool_name = sys.intern(name)  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def _default(obj: Any) -> Any:
+    """orjson fallback encoder matching the stdlib's handling of builtin subclasses.
+
+    orjson only encodes exact tuples and floats natively, so subclasses such
+    as namedtuples would otherwise be stringified. Everything else is
+    stringified, as with ``default=str``.
+    """
+    if isinstance(obj, tuple):
+        return list(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    return str(obj)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to indented JSON text.
+
+    Uses orjson when installed (``our-mcp-base[fast]``), falling back to the
+    stdlib for payloads orjson rejects (e.g. integers wider than 64 bits).
+    Datetimes and dataclasses are passed through to the fallback encoder so they
+    are stringified as in the stdlib path, and tuple and float subclasses are
+    encoded as lists and numbers. orjson still encodes Enum members by value
+    and NaN/Infinity as null, where the stdlib emits str(member) and the
+    non-standard NaN/Infinity tokens.
+    """
+    if orjson is not None:
+        option = (
+            orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        try:
+            return orjson.dumps(obj, default=_default, option=option).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _canonical_args(arguments: dict[str, Any]) -> str:
+    """Serialize tool arguments to a compact, key-sorted string for cache keys."""
+    if orjson is not None:
+        try:
+            option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            return orjson.dumps(arguments, default=_default, option=option).decode()
+        except TypeError:
+            pass
+    return json.dumps(arguments, sort_keys=True, default=str, separators=(",", ":"))
+
 
 class MCPServerBase(ABC):
     """Base class for MCP servers.
@@ -32,11 +117,14 @@ class MCPServerBase(ABC):
     - Optional health check callable
     - Error handling in tool calls
     - JSON response formatting
+    - Async handle_tool support; sync handlers run in a worker thread so
+      blocking I/O does not stall the event loop
 
     Subclasses should implement:
     - server_name: The MCP server name
     - get_tools(): Return list of Tool definitions
-    - handle_tool(): Handle tool calls
+    - Tool handlers, either as methods decorated with @tool("name") or by
+      overriding handle_tool()
 
     External dependencies are injectable:
     - startup_hook: Called during server startup (e.g., DB schema init)
@@ -50,10 +138,9 @@ class MCPServerBase(ABC):
             def get_tools(self) -> list[Tool]:
                 return [Tool(name="my_tool", ...)]
 
-            def handle_tool(self, name: str, arguments: dict) -> dict:
-                if name == "my_tool":
-                    return {"success": True, "data": "..."}
-                return {"success": False, "error": f"Unknown tool: {name}"}
+            @tool("my_tool")
+            def my_tool(self, query: str) -> dict:
+                return {"success": True, "data": "..."}
 
         if __name__ == "__main__":
             MyServer().run()
@@ -67,12 +154,32 @@ class MCPServerBase(ABC):
 
     server_name: str = "mcp-server"
     server_description: str = "MCP Server"
+    # Run a sync handle_tool via asyncio.to_thread. Disable for handlers that
+    # depend on running on the event loop thread (e.g. thread-bound connections).
+    sync_tools_in_thread: bool = True
+    # Call get_tools() once and reuse the list. Disable for servers whose tool list changes at runtime.
+    cache_tools: bool = True
+    # Maximum number of entries kept in the tool result cache (LRU eviction)
+    result_cache_size: int = 1024
+
+    # Tool name -> method attribute name, collected from @tool-decorated methods
+    _tool_methods: ClassVar[dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        tool_methods = dict(cls._tool_methods)
+        for attr, value in vars(cls).items():
+            tool_name = getattr(value, "_tool_name", None)
+            if tool_name is not None:
+                tool_methods[tool_name] = attr
+        cls._tool_methods = tool_methods
 
     def __init__(
         self,
         startup_hook: Callable[[], None] | None = None,
         health_check: Callable[[], int] | None = None,
         error_handlers: list[tuple[type[Exception], Callable[[Exception, str], list[TextContent]]]] | None = None,
+        cache_policy: Callable[[str], tuple[float, bool]] | None = None,
     ) -> None:
         """Initialize the MCP server.
 
@@ -84,10 +191,39 @@ class MCPServerBase(ABC):
             error_handlers: Optional list of (ExceptionType, handler) tuples for custom
                             error handling in tool calls. Checked in order; first match wins.
                             Handler receives (exception, tool_name) and returns list[TextContent].
+            cache_policy: Optional callable mapping a tool name to (ttl_seconds, cacheable).
+                          Results of cacheable tools are cached in-process, keyed by tool
+                          name and arguments, for ttl_seconds. Responses with a falsy
+                          'success' are not cached. Only use for tools whose result
+                          depends solely on their arguments.
         """
         self._startup_hook = startup_hook
         self._health_check = health_check
-        self._error_handlers = error_handlers or []
+        self._error_handlers = tuple(error_handlers or ())
+        # Exact-type lookup table mapping each registered type to its (position, handler).
+        # The earliest registration of a type wins, matching the linear scan.
+        self._err_map: dict[type[Exception], tuple[int, Callable[[Exception, str], list[TextContent]]]] = {}
+        for index, (exc_type, handler) in enumerate(self._error_handlers):
+            self._err_map.setdefault(exc_type, (index, handler))
+        # Types with custom isinstance semantics (ABCs) cannot be resolved via the MRO
+        self._err_virtual = any(type(exc_type) is not type for exc_type in self._err_map)
+        # Bound once so the per-call hot path avoids repeated attribute lookups
+        self._handle_tool_fn = self.handle_tool
+        self._handle_tool_is_async = inspect.iscoroutinefunction(self._handle_tool_fn)
+        self._dispatch: dict[str, Callable[..., dict[str, Any]]] = {
+            tool_name: getattr(self, attr) for tool_name, attr in self._tool_methods.items()
+        }
+        # Async @tool methods are awaited on the loop when the default handle_tool dispatches them
+        self._async_tools: frozenset[str] = frozenset()
+        if type(self).handle_tool is MCPServerBase.handle_tool:
+            self._async_tools = frozenset(
+                tool_name for tool_name, method in self._dispatch.items() if inspect.iscoroutinefunction(method)
+            )
+        self._cache_policy = cache_policy
+        # (name, canonical args) -> (expiry, serialized result), oldest first
+        self._result_cache: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+        self._tools_cache: list[Tool] | None = None
+        self._init_options: InitializationOptions | None = None
         self.server = Server(self.server_name)
         self._setup_handlers()
 
@@ -96,26 +232,67 @@ class MCPServerBase(ABC):
 
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
-            return self.get_tools()
+            return self._list_tools()
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-            return await self._handle_tool_call(name, arguments)
+            # Names arrive freshly decoded from JSON; interning once here lets every
+            # downstream dict lookup (ToolRouter, dispatch tables) match on identity.
+            return await self._handle_tool_call(sys.intern(name), arguments)
+
+    def _list_tools(self) -> list[Tool]:
+        """Return the tool list, calling get_tools() only once when cache_tools is set."""
+        if not self.cache_tools:
+            return self.get_tools()
+        if self._tools_cache is None:
+            self._tools_cache = self.get_tools()
+        return self._tools_cache
+
+    def _initialization_options(self) -> InitializationOptions:
+        """Return the MCP initialization options, built once per server instance."""
+        if self._init_options is None:
+            self._init_options = self.server.create_initialization_options()
+        return self._init_options
 
     async def _handle_tool_call(self, name: str, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle a tool call with consistent error handling."""
+        result: Any
+        cache_key: tuple[str, str] | None = None
         try:
-            result = self.handle_tool(name, arguments)
-            return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+            if self._cache_policy is not None:
+                ttl, cacheable = self._cache_policy(name)
+                if cacheable and ttl > 0:
+                    cache_key = (name, _canonical_args(arguments))
+                    cached = self._get_cached_result(cache_key)
+                    if cached is not None:
+                        return [TextContent(type="text", text=cached)]
+
+            if self._handle_tool_is_async or name in self._async_tools:
+                result = await cast(Awaitable[dict[str, Any]], self._handle_tool_fn(name, arguments))
+            elif self.sync_tools_in_thread:
+                result = await asyncio.to_thread(self._handle_tool_fn, name, arguments)
+            else:
+                result = self._handle_tool_fn(name, arguments)
+            # A sync callable can still hand back a coroutine, e.g. an async handle_tool
+            # behind a sync decorator, or an override delegating to an async @tool method
+            if inspect.isawaitable(result):
+                result = await result
+            text = _dumps(result)
+            # Failure responses (e.g. not found, backend unavailable) may stop being
+            # true at any moment, so only successful results are cached.
+            succeeded = not isinstance(result, dict) or result.get("success", True)
+            if cache_key is not None and succeeded:
+                self._store_cached_result(cache_key, text, ttl)
+            return [TextContent(type="text", text=text)]
 
         except Exception as e:
             # Check custom error handlers first
-            for exc_type, handler in self._error_handlers:
-                if isinstance(e, exc_type):
-                    return handler(e, name)
+            handler = self._find_error_handler(e)
+            if handler is not None:
+                return handler(e, name)
 
             # Default: log and return generic error
-            logger.exception(f"Unexpected error in tool {name}")
+            logger.exception("Unexpected error in tool %s", name)
             return [
                 TextContent(
                     type="text",
@@ -128,19 +305,87 @@ class MCPServerBase(ABC):
                 )
             ]
 
+    def _get_cached_result(self, key: tuple[str, str]) -> str | None:
+        """Return a cached serialized result, or None if absent or expired."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, text = entry
+        if expires_at <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return text
+
+    def _store_cached_result(self, key: tuple[str, str], text: str, ttl: float) -> None:
+        """Cache a serialized result, evicting the least recently used entries."""
+        cache = self._result_cache
+        cache[key] = (time.monotonic() + ttl, text)
+        cache.move_to_end(key)
+        while len(cache) > self.result_cache_size:
+            cache.popitem(last=False)
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Drop cached tool results.
+
+        Args:
+            name: Tool whose results to drop. Clears the whole cache if None.
+        """
+        if name is None:
+            self._result_cache.clear()
+            return
+        for key in [key for key in self._result_cache if key[0] == name]:
+            del self._result_cache[key]
+
+    def _find_error_handler(self, exc: Exception) -> Callable[[Exception, str], list[TextContent]] | None:
+        """Return the first registered handler matching exc, or None.
+
+        Walks the exception's MRO against the lookup table and picks the match
+        registered earliest, so ordering semantics are identical to checking
+        each handler with isinstance in turn.
+        """
+        if self._err_virtual:
+            for exc_type, handler in self._error_handlers:
+                if isinstance(exc, exc_type):
+                    return handler
+            return None
+
+        best: tuple[int, Callable[[Exception, str], list[TextContent]]] | None = None
+        err_map = self._err_map
+        for cls in type(exc).__mro__:
+            entry = err_map.get(cls)
+            if entry is not None and (best is None or entry[0] < best[0]):
+                best = entry
+        return best[1] if best is not None else None
+
     @abstractmethod
     def get_tools(self) -> list[Tool]:
         """Return list of tools provided by this server.
 
-        Must be implemented by subclasses.
+        Must be implemented by subclasses. Called once and cached for the
+        server's lifetime unless cache_tools is False.
         """
         ...
 
-    @abstractmethod
-    def handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    def handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any] | Awaitable[dict[str, Any]]:
         """Handle a tool call and return result.
 
-        Must be implemented by subclasses.
+        The default implementation dispatches to the method registered for name
+        with @tool, passing arguments as keyword arguments. ``async def`` tool
+        methods are awaited on the event loop; sync ones follow the same rules as
+        a sync handle_tool.
+
+        Subclasses may override this instead of using @tool, either as a regular
+        method (run in a worker thread unless sync_tools_in_thread is False) or as
+        an ``async def``, which is awaited on the event loop. When handle_tool is
+        overridden, async @tool methods are no longer scheduled on the loop
+        directly: an override that delegates to them must return the resulting
+        coroutine, which is then awaited after the override itself returns.
+
+        Sync handlers running in worker threads may be invoked concurrently for
+        overlapping requests, each on an arbitrary pool thread. Guard shared
+        mutable state with a lock, and set sync_tools_in_thread to False for
+        thread-affine resources.
 
         Args:
             name: The tool name
@@ -149,7 +394,11 @@ class MCPServerBase(ABC):
         Returns:
             Dict with 'success' key and either result data or 'error' key
         """
-        ...
+        try:
+            handler = self._dispatch[name]
+        except KeyError:
+            return error_response(f"Unknown tool: {name}")
+        return handler(**arguments)
 
     def parse_args(self) -> argparse.Namespace:
         """Parse command line arguments."""
@@ -168,14 +417,17 @@ class MCPServerBase(ABC):
         return parser.parse_args()
 
     def run(self) -> None:
-        """Run the MCP server."""
+        """Run the MCP server.
+
+        Uses the uvloop event loop when it is installed (``our-mcp-base[fast]``).
+        """
         args = self.parse_args()
 
         # Health check mode
         if self._health_check is not None and getattr(args, "health_check", False):
             sys.exit(self._health_check())
 
-        logger.info(f"{self.server_name} MCP server starting...")
+        logger.info("%s MCP server starting...", self.server_name)
 
         # Run startup hook (unless skipped)
         if self._startup_hook is not None and not getattr(args, "skip_startup_hook", False):
@@ -186,13 +438,15 @@ class MCPServerBase(ABC):
                 logger.exception("Startup hook failed")
                 raise
 
+        init_options = self._initialization_options()
+
         # Run the server
         async def main() -> None:
             async with stdio_server() as (read_stream, write_stream):
-                await self.server.run(
-                    read_stream,
-                    write_stream,
-                    self.server.create_initialization_options(),
-                )
+                await self.server.run(read_stream, write_stream, init_options)
 
-        asyncio.run(main())
+        if uvloop is not None:
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(main())
+        else:
+            asyncio.run(main())
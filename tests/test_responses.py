@@ -20,6 +20,12 @@ class TestSuccessResponse:
         assert result["data"] == "test"
         assert result["count"] == 42
 
+    def test_returns_fresh_dict(self) -> None:
+        """Should return a new dict on each call so callers can mutate it."""
+        first = success_response()
+        first["extra"] = 1
+        assert success_response() == {"success": True}
+
     def test_with_nested_data(self) -> None:
         """Should handle nested data."""
         result = success_response(
@@ -59,6 +65,10 @@ class TestNotFoundResponse:
         assert "User not found" in result["error"]
         assert "abc-123" in result["error"]
 
+    def test_matches_error_response_shape(self) -> None:
+        """Should produce exactly the same dict as the equivalent error_response."""
+        assert not_found_response("User", "abc-123") == error_response("User not found: abc-123")
+
     def test_different_resource_types(self) -> None:
         """Should work with different resource types."""
         result1 = not_found_response("Entity", "entity-1")
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
+import pytest
+
 from our_mcp_base.router import ToolRouter
 
 
@@ -39,6 +42,29 @@ class TestToolRouter:
         assert result["success"] is False
         assert "Unknown tool" in result["error"]
 
+    def test_dispatch_propagates_handler_key_error(self) -> None:
+        """Should not mistake a KeyError raised by a handler for an unknown tool."""
+        router = ToolRouter()
+
+        @router.register("lookup")
+        def handler() -> dict[str, Any]:
+            return {}["missing"]
+
+        with pytest.raises(KeyError, match="missing"):
+            router.dispatch("lookup", {})
+
+    def test_register_interns_name(self) -> None:
+        """Should store registered names interned."""
+        router = ToolRouter()
+        name = "".join(["dyn", "_tool"])
+
+        @router.register(name)
+        def handler() -> dict[str, Any]:
+            return {}
+
+        assert router.tool_names[0] is sys.intern("dyn_tool")
+        assert router.dispatch("dyn_tool", {}) == {}
+
     def test_has_tool(self) -> None:
         """Should check if tool is registered."""
         router = ToolRouter()
@@ -67,6 +93,30 @@ class TestToolRouter:
         assert "tool_b" in names
         assert len(names) == 2
 
+    def test_tool_names_cached_until_register(self) -> None:
+        """Should reuse the names snapshot until a new tool is registered."""
+        router = ToolRouter()
+
+        @router.register("tool_a")
+        def a() -> dict[str, Any]:
+            return {}
+
+        first = router.tool_names
+        snapshot = router._names_cache
+        first.append("mutated")
+        assert router.tool_names == ["tool_a"]
+        assert router._names_cache is snapshot
+
+        @router.register("tool_b")
+        def b() -> dict[str, Any]:
+            return {}
+
+        assert router.tool_names == ["tool_a", "tool_b"]
+
+    def test_slots(self) -> None:
+        """Should not carry a per-instance __dict__."""
+        assert not hasattr(ToolRouter(), "__dict__")
+
     def test_multiple_handlers(self) -> None:
         """Should handle multiple registered tools."""
         router = ToolRouter()
@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import dataclasses
+import datetime
+import decimal
+import enum
+import functools
 import json
+import math
+import sqlite3
+import threading
+import uuid
+from abc import ABC
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from mcp.types import TextContent, Tool
 
-from our_mcp_base.server import MCPServerBase
+from our_mcp_base import server as server_module
+from our_mcp_base.responses import not_found_response
+from our_mcp_base.server import MCPServerBase, _dumps, tool
 
 
 class TestMCPServerBaseAbstract:
@@ -35,6 +51,20 @@ class TestMCPServerBaseAbstract:
         server = TestServer()
         assert server.server_name == "test-server"
 
+    def test_combines_with_slotted_mixin(self) -> None:
+        """Should allow multiple inheritance with mixins that declare non-empty __slots__."""
+
+        class SlottedMixin:
+            __slots__ = ("extra",)
+
+        class TestServer(SlottedMixin, MCPServerBase):
+            def get_tools(self) -> list[Tool]:
+                return []
+
+        server = TestServer()
+        server.extra = 1
+        assert server.handle_tool("missing", {})["success"] is False
+
     def test_default_server_name(self) -> None:
         """Should have default server name and description."""
 
@@ -50,6 +80,39 @@ class TestMCPServerBaseAbstract:
         assert server.server_description == "MCP Server"
 
 
+class TestMCPServerBaseListTools:
+    """Tests for MCPServerBase tool list caching."""
+
+    @staticmethod
+    def _make_server(cache_tools: bool) -> Any:
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def __init__(self) -> None:
+                self.get_tools_calls = 0
+                super().__init__()
+
+            def get_tools(self) -> list[Tool]:
+                self.get_tools_calls += 1
+                return [Tool(name=f"tool_{self.get_tools_calls}", inputSchema={"type": "object"})]
+
+        TestServer.cache_tools = cache_tools
+        return TestServer()
+
+    def test_get_tools_called_once(self) -> None:
+        """Should reuse the first get_tools() result."""
+        server = self._make_server(cache_tools=True)
+        first = server._list_tools()
+        assert server._list_tools() is first
+        assert server.get_tools_calls == 1
+
+    def test_cache_disabled(self) -> None:
+        """Should call get_tools() on every request when cache_tools is False."""
+        server = self._make_server(cache_tools=False)
+        assert server._list_tools()[0].name == "tool_1"
+        assert server._list_tools()[0].name == "tool_2"
+
+
 class TestMCPServerBaseHandleToolCall:
     """Tests for MCPServerBase._handle_tool_call method."""
 
@@ -89,6 +152,426 @@ class TestMCPServerBaseHandleToolCall:
         assert data["success"] is False
         assert "Internal error" in data["error"]
 
+    @pytest.mark.asyncio
+    async def test_generic_error_payload_is_compact(self, test_server: MCPServerBase) -> None:
+        """Should keep the internal error payload on a single line."""
+        result = await test_server._handle_tool_call("generic_error", {})
+        assert result[0].text == '{"success": false, "error": "Internal error: Unknown error"}'
+
+
+class TestMCPServerBaseAsyncHandleTool:
+    """Tests for async and thread-offloaded handle_tool execution."""
+
+    @pytest.mark.asyncio
+    async def test_async_handle_tool_awaited(self) -> None:
+        """Should await an async handle_tool on the event loop."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            async def handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+                await asyncio.sleep(0)
+                return {"success": True, "name": name}
+
+        result = await TestServer()._handle_tool_call("async_tool", {})
+        assert json.loads(result[0].text) == {"success": True, "name": "async_tool"}
+
+    @pytest.mark.asyncio
+    async def test_async_handle_tool_error(self) -> None:
+        """Should apply default error handling to async handlers."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            async def handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+                raise RuntimeError("async failure")
+
+        result = await TestServer()._handle_tool_call("tool", {})
+        data = json.loads(result[0].text)
+        assert data["success"] is False
+        assert "async failure" in data["error"]
+
+    @pytest.mark.asyncio
+    async def test_wrapped_async_handle_tool_awaited(self) -> None:
+        """Should await the coroutine returned by an async handle_tool behind a sync wrapper."""
+
+        def traced(func: Callable[..., Any]) -> Callable[..., Any]:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            @traced
+            async def handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+                await asyncio.sleep(0)
+                return {"success": True, "name": name}
+
+        result = await TestServer()._handle_tool_call("wrapped", {})
+        assert json.loads(result[0].text) == {"success": True, "name": "wrapped"}
+
+    @pytest.mark.asyncio
+    async def test_override_delegating_to_async_tool_awaited(self) -> None:
+        """Should await async @tool methods reached through an overriding sync handle_tool."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            @tool("async_tool")
+            async def async_tool(self) -> dict[str, Any]:
+                return {"success": True}
+
+            def handle_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+                return super().handle_tool(name, arguments)
+
+        result = await TestServer()._handle_tool_call("async_tool", {})
+        assert json.loads(result[0].text) == {"success": True}
+
+    @pytest.mark.asyncio
+    async def test_sync_handle_tool_runs_in_thread(self) -> None:
+        """Should run sync handlers off the event loop thread by default."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            def handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+                return {"thread": threading.get_ident()}
+
+        result = await TestServer()._handle_tool_call("tool", {})
+        assert json.loads(result[0].text)["thread"] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_sync_handle_tool_inline_when_disabled(self) -> None:
+        """Should run sync handlers on the event loop thread when offloading is disabled."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+            sync_tools_in_thread = False
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            def handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+                return {"thread": threading.get_ident()}
+
+        result = await TestServer()._handle_tool_call("tool", {})
+        assert json.loads(result[0].text)["thread"] == threading.get_ident()
+
+
+class TestMCPServerBaseResultCache:
+    """Tests for MCPServerBase tool result caching via cache_policy."""
+
+    @pytest.fixture
+    def counting_server_cls(self) -> type[MCPServerBase]:
+        """Create a server class that counts handler invocations."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+            sync_tools_in_thread = False
+
+            def __init__(self, **kwargs: Any) -> None:
+                self.calls = 0
+                super().__init__(**kwargs)
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            def handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+                self.calls += 1
+                if name == "fail":
+                    raise RuntimeError("boom")
+                if name == "missing":
+                    return not_found_response("User", "1")
+                return {"success": True, "calls": self.calls, "args": arguments}
+
+        return TestServer
+
+    @pytest.mark.asyncio
+    async def test_no_policy_does_not_cache(self, counting_server_cls: type[Any]) -> None:
+        """Should call the handler every time without a cache policy."""
+        server = counting_server_cls()
+        await server._handle_tool_call("lookup", {"q": 1})
+        await server._handle_tool_call("lookup", {"q": 1})
+        assert server.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_caches_by_name_and_arguments(self, counting_server_cls: type[Any]) -> None:
+        """Should reuse results for identical calls, regardless of argument order."""
+        server = counting_server_cls(cache_policy=lambda name: (60, name == "lookup"))
+        first = await server._handle_tool_call("lookup", {"a": 1, "b": [1, 2]})
+        second = await server._handle_tool_call("lookup", {"b": [1, 2], "a": 1})
+        assert first[0].text == second[0].text
+        assert server.calls == 1
+
+        await server._handle_tool_call("lookup", {"a": 2, "b": [1, 2]})
+        await server._handle_tool_call("other", {})
+        await server._handle_tool_call("other", {})
+        assert server.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_recomputed(self, counting_server_cls: type[Any]) -> None:
+        """Should call the handler again once the TTL has elapsed."""
+        server = counting_server_cls(cache_policy=lambda name: (10, True))
+        with patch("our_mcp_base.server.time.monotonic", return_value=100.0):
+            await server._handle_tool_call("lookup", {})
+        with patch("our_mcp_base.server.time.monotonic", return_value=111.0):
+            await server._handle_tool_call("lookup", {})
+        assert server.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self, counting_server_cls: type[Any]) -> None:
+        """Should not cache results of calls that raised."""
+        server = counting_server_cls(cache_policy=lambda name: (60, True))
+        await server._handle_tool_call("fail", {})
+        await server._handle_tool_call("fail", {})
+        assert server.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_responses_not_cached(self, counting_server_cls: type[Any]) -> None:
+        """Should not cache responses whose success flag is false."""
+        server = counting_server_cls(cache_policy=lambda name: (300, True))
+        first = await server._handle_tool_call("missing", {})
+        await server._handle_tool_call("missing", {})
+        assert json.loads(first[0].text)["success"] is False
+        assert server.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, counting_server_cls: type[Any]) -> None:
+        """Should drop cached results for one tool or all tools."""
+        server = counting_server_cls(cache_policy=lambda name: (60, True))
+        await server._handle_tool_call("a", {})
+        await server._handle_tool_call("b", {})
+
+        server.invalidate("a")
+        await server._handle_tool_call("a", {})
+        await server._handle_tool_call("b", {})
+        assert server.calls == 3
+
+        server.invalidate()
+        await server._handle_tool_call("b", {})
+        assert server.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, counting_server_cls: type[Any]) -> None:
+        """Should evict the least recently used entry when full."""
+        server = counting_server_cls(cache_policy=lambda name: (60, True))
+        server.result_cache_size = 2
+        await server._handle_tool_call("a", {})
+        await server._handle_tool_call("b", {})
+        await server._handle_tool_call("a", {})  # hit; b is now least recent
+        await server._handle_tool_call("c", {})  # evicts b
+        assert server.calls == 3
+
+        await server._handle_tool_call("a", {})
+        assert server.calls == 3
+        await server._handle_tool_call("b", {})
+        assert server.calls == 4
+
+
+class TestMCPServerBaseToolDecorator:
+    """Tests for @tool-decorated dispatch via the default handle_tool."""
+
+    def test_dispatches_to_decorated_method(self) -> None:
+        """Should call the method registered for the tool name with keyword arguments."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            @tool("double")
+            def double(self, value: int) -> dict[str, Any]:
+                return {"success": True, "result": value * 2}
+
+        server = TestServer()
+        assert server.handle_tool("double", {"value": 4}) == {"success": True, "result": 8}
+
+    def test_unknown_tool(self) -> None:
+        """Should return an error response for unregistered tools."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+        result = TestServer().handle_tool("missing", {})
+        assert result["success"] is False
+        assert "Unknown tool: missing" in result["error"]
+
+    def test_inherits_and_overrides_tools(self) -> None:
+        """Should inherit parent tools and let subclasses override them by method name."""
+
+        class ParentServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            @tool("a")
+            def tool_a(self) -> dict[str, Any]:
+                return {"from": "parent"}
+
+            @tool("b")
+            def tool_b(self) -> dict[str, Any]:
+                return {"from": "parent"}
+
+        class ChildServer(ParentServer):
+            def tool_a(self) -> dict[str, Any]:
+                return {"from": "child"}
+
+            @tool("c")
+            def tool_c(self) -> dict[str, Any]:
+                return {"from": "child"}
+
+        child = ChildServer()
+        assert child.handle_tool("a", {}) == {"from": "child"}
+        assert child.handle_tool("b", {}) == {"from": "parent"}
+        assert child.handle_tool("c", {}) == {"from": "child"}
+        assert ParentServer().handle_tool("c", {})["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_async_decorated_method_awaited(self) -> None:
+        """Should await async @tool methods on the event loop and run sync ones in a thread."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            @tool("async_tool")
+            async def async_tool(self, value: int) -> dict[str, Any]:
+                await asyncio.sleep(0)
+                return {"success": True, "value": value, "thread": threading.get_ident()}
+
+            @tool("sync_tool")
+            def sync_tool(self) -> dict[str, Any]:
+                return {"success": True, "thread": threading.get_ident()}
+
+        server = TestServer()
+        async_data = json.loads((await server._handle_tool_call("async_tool", {"value": 3}))[0].text)
+        assert async_data == {"success": True, "value": 3, "thread": threading.get_ident()}
+        sync_data = json.loads((await server._handle_tool_call("sync_tool", {}))[0].text)
+        assert sync_data["thread"] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_handle_tool_call_uses_decorated_method(self) -> None:
+        """Should serialize the decorated method's result through _handle_tool_call."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            @tool("echo")
+            def echo(self, text: str) -> dict[str, Any]:
+                return {"success": True, "text": text}
+
+        result = await TestServer()._handle_tool_call("echo", {"text": "hi"})
+        assert json.loads(result[0].text) == {"success": True, "text": "hi"}
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+    y: int
+
+
+_Row = collections.namedtuple("_Row", ["id", "name"])
+
+
+class _Celsius(float):
+    pass
+
+
+class TestDumps:
+    """Tests for the _dumps serialization helper."""
+
+    def test_stringifies_unserializable_values(self) -> None:
+        """Should fall back to str() for values JSON cannot encode."""
+        obj = object()
+        assert json.loads(_dumps({"value": obj})) == {"value": str(obj)}
+
+    def test_non_str_keys(self) -> None:
+        """Should coerce non-string keys like the stdlib encoder does."""
+        assert json.loads(_dumps({1: "a"})) == {"1": "a"}
+
+    def test_large_int_falls_back_to_stdlib(self) -> None:
+        """Should handle integers wider than 64 bits."""
+        assert json.loads(_dumps({"n": 2**70})) == {"n": 2**70}
+
+    def test_without_orjson(self) -> None:
+        """Should produce the same output when orjson is unavailable."""
+        with patch.object(server_module, "orjson", None):
+            assert json.loads(_dumps({"success": True, "n": 1})) == {"success": True, "n": 1}
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime.datetime(2024, 1, 1, 12, 0, 0),
+            datetime.datetime(2024, 1, 1, 12, 0, 0, tzinfo=datetime.UTC),
+            datetime.date(2024, 1, 1),
+            datetime.time(1, 2, 3),
+            _Point(1, 2),
+            uuid.UUID(int=1),
+            decimal.Decimal("1.50"),
+            _Row(1, "a"),
+            [_Row(1, "a"), _Row(2, "b")],
+            _Celsius(21.5),
+        ],
+        ids=[
+            "datetime",
+            "aware_datetime",
+            "date",
+            "time",
+            "dataclass",
+            "uuid",
+            "decimal",
+            "namedtuple",
+            "namedtuple_rows",
+            "float_subclass",
+        ],
+    )
+    def test_orjson_matches_stdlib(self, value: Any) -> None:
+        """Should produce the same values with and without orjson."""
+        pytest.importorskip("orjson")
+        fast = json.loads(_dumps({"value": value}))
+        with patch.object(server_module, "orjson", None):
+            stdlib = json.loads(_dumps({"value": value}))
+        assert fast == stdlib
+
+    def test_orjson_documented_differences(self) -> None:
+        """Should encode Enum members by value and NaN as null with orjson, as documented."""
+        pytest.importorskip("orjson")
+        color = enum.Enum("Color", {"RED": "red"})
+        payload = {"color": color.RED, "nan": float("nan")}
+        assert json.loads(_dumps(payload)) == {"color": "red", "nan": None}
+        with patch.object(server_module, "orjson", None):
+            stdlib = json.loads(_dumps(payload))
+        assert stdlib["color"] == "Color.RED"
+        assert math.isnan(stdlib["nan"])
+
 
 class TestMCPServerBaseCustomErrorHandlers:
     """Tests for MCPServerBase with custom error handlers."""
@@ -160,6 +643,66 @@ class TestMCPServerBaseCustomErrorHandlers:
         data = json.loads(result[0].text)
         assert data["handler"] == "specific"
 
+    @pytest.mark.asyncio
+    async def test_base_handler_listed_first_wins(self) -> None:
+        """Should honour registration order even when a more specific handler exists."""
+
+        class BaseError(Exception):
+            pass
+
+        class SpecificError(BaseError):
+            pass
+
+        def handle_specific(exc: Exception, tool_name: str) -> list[TextContent]:
+            return [TextContent(type="text", text=json.dumps({"handler": "specific"}))]
+
+        def handle_base(exc: Exception, tool_name: str) -> list[TextContent]:
+            return [TextContent(type="text", text=json.dumps({"handler": "base"}))]
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            def handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+                raise SpecificError("oops")
+
+        # BaseError listed first -- should match before the more specific handler
+        server = TestServer(error_handlers=[(BaseError, handle_base), (SpecificError, handle_specific)])
+        result = await server._handle_tool_call("tool", {})
+        data = json.loads(result[0].text)
+        assert data["handler"] == "base"
+
+    @pytest.mark.asyncio
+    async def test_virtual_subclass_handler(self) -> None:
+        """Should match handlers registered for ABCs via virtual subclassing."""
+
+        class VirtualError(Exception, ABC):  # noqa: B024
+            pass
+
+        class ConcreteError(Exception):
+            pass
+
+        VirtualError.register(ConcreteError)
+
+        def handle_virtual(exc: Exception, tool_name: str) -> list[TextContent]:
+            return [TextContent(type="text", text=json.dumps({"handler": "virtual"}))]
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            def handle_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+                raise ConcreteError("oops")
+
+        server = TestServer(error_handlers=[(VirtualError, handle_virtual)])
+        result = await server._handle_tool_call("tool", {})
+        data = json.loads(result[0].text)
+        assert data["handler"] == "virtual"
+
     @pytest.mark.asyncio
     async def test_unmatched_falls_through_to_default(self) -> None:
         """Should fall through to default handler if no custom handler matches."""
@@ -249,6 +792,24 @@ class TestMCPServerBaseParseArgs:
 class TestMCPServerBaseRun:
     """Tests for MCPServerBase.run method."""
 
+    @pytest.fixture(autouse=True)
+    def _no_uvloop(self) -> Iterator[None]:
+        """Route run() through asyncio.run regardless of whether uvloop is installed."""
+        with patch.object(server_module, "uvloop", None):
+            yield
+
+    @pytest.fixture
+    def fake_transport(self) -> Iterator[AsyncMock]:
+        """Replace the stdio transport and session loop so main() runs to completion."""
+
+        @asynccontextmanager
+        async def fake_stdio_server() -> AsyncIterator[tuple[None, None]]:
+            yield None, None
+
+        with patch.object(server_module, "stdio_server", fake_stdio_server):
+            with patch("mcp.server.Server.run", new_callable=AsyncMock) as mock_server_run:
+                yield mock_server_run
+
     def test_health_check_mode(self) -> None:
         """Should run health check and exit in health check mode."""
 
@@ -356,6 +917,120 @@ class TestMCPServerBaseRun:
                 server.run()
             mock_run.assert_called_once()
 
+    def test_uses_uvloop_when_available(self) -> None:
+        """Should run the server on a uvloop event loop when uvloop is installed."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+        server = TestServer()
+        fake_uvloop = MagicMock()
+
+        with patch("sys.argv", ["test"]):
+            with patch.object(server_module, "uvloop", fake_uvloop):
+                with patch("asyncio.Runner") as mock_runner, patch("asyncio.run") as mock_run:
+                    server.run()
+
+        mock_runner.assert_called_once_with(loop_factory=fake_uvloop.new_event_loop)
+        runner = mock_runner.return_value.__enter__.return_value
+        runner.run.assert_called_once()
+        runner.run.call_args.args[0].close()
+        mock_run.assert_not_called()
+
+    def test_startup_hook_runs_on_loop_thread_before_session(self, fake_transport: AsyncMock) -> None:
+        """Should run the startup hook on the event loop's thread and finish it before serving."""
+        threads: dict[str, int] = {}
+        order: list[str] = []
+
+        def my_hook() -> None:
+            threads["hook"] = threading.get_ident()
+            order.append("hook")
+
+        async def session(*args: Any) -> None:
+            threads["loop"] = threading.get_ident()
+            order.append("session")
+
+        fake_transport.side_effect = session
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+        server = TestServer(startup_hook=my_hook)
+
+        with patch("sys.argv", ["test"]):
+            server.run()
+
+        assert threads["hook"] == threads["loop"]
+        assert order == ["hook", "session"]
+
+    def test_hook_resource_usable_from_inline_handler(self, fake_transport: AsyncMock) -> None:
+        """Should let inline handlers use thread-bound resources created by the startup hook."""
+        responses: list[dict[str, Any]] = []
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+            sync_tools_in_thread = False
+
+            def __init__(self) -> None:
+                self.conn: sqlite3.Connection | None = None
+                super().__init__(startup_hook=self.init_db)
+
+            def init_db(self) -> None:
+                self.conn = sqlite3.connect(":memory:")
+                self.conn.execute("CREATE TABLE items (name TEXT)")
+                self.conn.execute("INSERT INTO items VALUES ('widget')")
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+            @tool("list_items")
+            def list_items(self) -> dict[str, Any]:
+                assert self.conn is not None
+                rows = self.conn.execute("SELECT name FROM items").fetchall()
+                return {"success": True, "items": [row[0] for row in rows]}
+
+        server = TestServer()
+
+        async def session(*args: Any) -> None:
+            result = await server._handle_tool_call("list_items", {})
+            responses.append(json.loads(result[0].text))
+
+        fake_transport.side_effect = session
+
+        with patch("sys.argv", ["test"]):
+            server.run()
+
+        assert responses == [{"success": True, "items": ["widget"]}]
+
+    def test_initialization_options_built_once(self, fake_transport: AsyncMock) -> None:
+        """Should reuse the same initialization options across repeated runs."""
+
+        class TestServer(MCPServerBase):
+            server_name = "test"
+
+            def get_tools(self) -> list[Tool]:
+                return []
+
+        server = TestServer()
+
+        with patch("sys.argv", ["test"]):
+            with patch.object(
+                server.server, "create_initialization_options", wraps=server.server.create_initialization_options
+            ) as mock_create:
+                server.run()
+                server.run()
+
+        mock_create.assert_called_once()
+        first, second = (call.args[2] for call in fake_transport.call_args_list)
+        assert first is second
+        assert first.server_name == "test"
+
     def test_startup_hook_failure_propagates(self) -> None:
         """Should propagate startup hook failures."""
 